@@ -25,26 +25,28 @@ def order_subcomponents(component: sbol3.Component) -> Union[Tuple[List[sbol3.Fe
     :return: if the features can be ordered, return a list of features in the order that they should be joined and
     a boolean indicating if it's circular. If the features cannot be ordered, return None
     """
-    # first, check for circularity of the construct
-    circular_components = id_sort(f for f in component.features if is_plasmid(f))
-    circular = len(circular_components) > 0
-
+    # snapshot of the features
+    features = list(component.features)
     # if there are no features, then no sequence can be computed
-    if not component.features:
+    if not features:
         return None
     # if there's precisely one feature, it doesn't need ordering
-    if len(component.features) == 1:
-        return [component.features[0]], circular
-
-    # otherwise, for N components, we should have a chain of N-1 meetings (possibly excepting one circular)
-    order = []
-    meetings = {c for c in component.constraints if c.restriction == sbol3.SBOL_MEETS}
-    # given a potential loop, designate the first circular component as the loop and remove any meetings starting there
-    if circular and len(meetings) == len(component.features):
-        meetings -= {m for m in meetings if m.subject == circular_components[0].identity}
+    if len(features) == 1:
+        return features, is_plasmid(features[0])
 
-    unordered = list(component.features)
     with cached_references(component.document):
+        # first, check for circularity of the construct, resolving SubComponent definitions through the cache
+        circular_components = id_sort(f for f in features if is_plasmid(f))
+        circular = len(circular_components) > 0
+
+        # otherwise, for N components, we should have a chain of N-1 meetings (possibly excepting one circular)
+        order = []
+        meetings = {c for c in component.constraints if c.restriction == sbol3.SBOL_MEETS}
+        # given a potential loop, designate the first circular component as the loop and remove meetings starting there
+        if circular and len(meetings) == len(features):
+            meetings -= {m for m in meetings if m.subject == circular_components[0].identity}
+
+        unordered = list(features)
         while meetings:
             # Meetings that can go next are any that are a subject and not an object
             unblocked = {find_child(m.subject) for m in meetings}-{find_child(m.object) for m in meetings}
@@ -63,7 +65,7 @@ def order_subcomponents(component: sbol3.Component) -> Union[Tuple[List[sbol3.Fe
                 unordered.remove(obj)
 
     # if all components have been ordered, then return the order
-    assert unordered or (len(order) == len(component.features))
+    assert unordered or (len(order) == len(features))
     return (order if not unordered else None), circular
 
 
@@ -84,15 +86,20 @@ def compute_sequence(component: sbol3.Component) -> sbol3.Sequence:
                               elements='',
                               encoding=sbol3.IUPAC_DNA_ENCODING)
     # for each component in turn, add it and set its location
+    # collect element strings and track the running length for each Range
+    parts = []
+    length = 0
     with cached_references(component.document):
         for subcomponent in sorted_subcomponents:
             subc = find_top_level(subcomponent.instance_of)
             assert len(subc.sequences) == 1
             subseq = find_top_level(subc.sequences[0])
             assert sequence.encoding == subseq.encoding
-            subcomponent.locations.append(sbol3.Range(sequence, len(sequence.elements) + 1,
-                                          len(sequence.elements) + len(subseq.elements)))
-            sequence.elements += subseq.elements
+            subelements = subseq.elements
+            subcomponent.locations.append(sbol3.Range(sequence, length + 1, length + len(subelements)))
+            parts.append(subelements)
+            length += len(subelements)
+    sequence.elements = ''.join(parts)
     # when all have been handled, the sequence is fully realized
     component.document.add(sequence)
     component.sequences.append(sequence)
@@ -114,19 +121,20 @@ def calculate_sequences(doc: sbol3.Document) -> List[sbol3.Sequence]:
     # figure out which components are potential targets for expansion
     dna_components = {obj for obj in doc.objects if isinstance(obj, sbol3.Component) and sbol3.SBO_DNA in obj.types}
     resolved = {c for c in dna_components if resolved_dna_component(c)}
-    pending_resolution = {c for c in (dna_components-resolved)
-                          if order_subcomponents(c) and not resolved_dna_component(c)}
+    pending_resolution = {c for c in (dna_components-resolved) if order_subcomponents(c)}
     logging.info(f'Found {len(dna_components)} DNA components, {len(pending_resolution)} needing sequences computed')
 
     # loop through sequences, attempting to resolve each in turn
+    # identities of resolved components
+    resolved_identities = {str(r.identity) for r in resolved}
     while pending_resolution:
-        resolvable = {c for c in pending_resolution if ready_to_resolve(c, {str(r.identity) for r in resolved})}
+        resolvable = {c for c in pending_resolution if ready_to_resolve(c, resolved_identities)}
         if not resolvable:
             break
         for c in resolvable:
             new_sequences.append(compute_sequence(c))
             logging.info(f'Computed sequence for {c.display_id}')
-        resolved = resolved.union(resolvable)
+        resolved_identities.update(str(c.identity) for c in resolvable)
         pending_resolution -= resolvable
 
     if len(pending_resolution) == 0:
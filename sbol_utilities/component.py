@@ -88,9 +88,9 @@ def is_dna_part(obj: sbol3.Component) -> bool:
     def check_roles(component: sbol3.Component) -> bool:
         return any(tyto.SO.get_term_by_uri(role) for role in component.roles)
 
-    # check all conditions
-    return isinstance(obj, sbol3.Component) and check_roles(obj) \
-        and has_dna_type(obj) and len(obj.sequences) == 1
+    # check all conditions, cheap structural checks first so that ontology lookups are only made when needed
+    return isinstance(obj, sbol3.Component) and len(obj.sequences) == 1 \
+        and check_roles(obj) and has_dna_type(obj)
 
 
 def ensure_singleton_feature(system: sbol3.Component, target: Union[sbol3.Feature, sbol3.Component]):
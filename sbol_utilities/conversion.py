@@ -14,13 +14,41 @@ from Bio import SeqIO, SeqRecord
 from Bio.Seq import Seq
 
 from sbol_utilities.helper_functions import strip_sbol2_version, GENETIC_DESIGN_FILE_TYPES, \
-    find_top_level
+    find_top_level, cached_references
 from sbol_utilities.workarounds import id_sort
 
 # sbol javascript executable based on https://github.com/sboltools/sbolgraph
 # Used for conversion between SBOL2 and SBOL3
 SBOLGRAPH = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'sbolgraph-standalone.js')
 
+# TODO: remove remap workarounds after conversions error fixed in https://github.com/sboltools/sbolgraph/issues/17
+# Remapping of SBOL2 sequence encodings, component types, and orientations to their SBOL3 equivalents
+_SBOL2_TO_SBOL3_ENCODINGS = {
+    sbol2.SBOL_ENCODING_IUPAC: sbol3.IUPAC_DNA_ENCODING,
+    sbol2.SBOL_ENCODING_IUPAC_PROTEIN: sbol3.IUPAC_PROTEIN_ENCODING,
+    sbol2.SBOL_ENCODING_SMILES: sbol3.SMILES_ENCODING
+}
+_SBOL2_TO_SBOL3_TYPES = {
+    sbol2.BIOPAX_DNA: sbol3.SBO_DNA,
+    sbol2.BIOPAX_RNA: sbol3.SBO_RNA,
+    sbol2.BIOPAX_PROTEIN: sbol3.SBO_PROTEIN,
+    sbol2.BIOPAX_SMALL_MOLECULE: sbol3.SBO_SIMPLE_CHEMICAL,
+    sbol2.BIOPAX_COMPLEX: sbol3.SBO_NON_COVALENT_COMPLEX
+}
+_SBOL2_TO_SBOL3_ORIENTATIONS = {
+    sbol2.SBOL_ORIENTATION_INLINE: sbol3.SBOL_INLINE,
+    sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT: sbol3.SBOL_REVERSE_COMPLEMENT
+}
+# TODO: remove remap workarounds after conversion errors fixed in https://github.com/sboltools/sbolgraph/issues/16
+# The SBOL3-to-SBOL2 remappings are the inverse of the above
+_SBOL3_TO_SBOL2_ENCODINGS = {v: k for k, v in _SBOL2_TO_SBOL3_ENCODINGS.items()}
+_SBOL3_TO_SBOL2_TYPES = {v: k for k, v in _SBOL2_TO_SBOL3_TYPES.items()}
+_SBOL3_TO_SBOL2_ORIENTATIONS = {v: k for k, v in _SBOL2_TO_SBOL3_ORIENTATIONS.items()}
+
+# Namespaces of the annotation properties that are retained on export to GenBank
+_GENBANK_KEPT_PROPERTY_NAMESPACES = ('http://sbols.org/v2', 'http://www.w3.org/ns/prov', 'http://purl.org/dc/terms/',
+                                     'http://sboltools.org/backport')
+
 
 def convert_identities2to3(sbol3_data: str) -> str:
     """Convert SBOL2 identities into SBOL3 identities.
@@ -41,7 +69,7 @@ def convert_identities2to3(sbol3_data: str) -> str:
             else:
                 g.add((s, p, rdflib.URIRef(sbol3.SBOL_TOP_LEVEL)))
 
-    subjects = sorted(list(set(g.subjects())))
+    subjects = sorted(set(g.subjects()))
     for old_identity in subjects:
         # Check if the identity needs to change:
         new_identity = rdflib.URIRef(strip_sbol2_version(old_identity))
@@ -80,12 +108,9 @@ def convert2to3(sbol2_doc: Union[str, sbol2.Document], namespaces=None) -> sbol3
         namespaces = []
     if isinstance(sbol2_doc, sbol2.Document):
         sbol2_path = tempfile.mkstemp(suffix='.xml')[1]
-        validate_online = sbol2.Config.getOption(sbol2.ConfigOptions.VALIDATE_ONLINE)
-        try:
-            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE_ONLINE, False)
-            sbol2_doc.write(sbol2_path)
-        finally:
-            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE_ONLINE, validate_online)
+        # writeString avoids Document.write's validation pass
+        with open(sbol2_path, 'w') as sbol2_file:
+            sbol2_file.write(sbol2_doc.writeString())
     else:
         sbol2_path = sbol2_doc
 
@@ -118,49 +143,34 @@ def convert2to3(sbol2_doc: Union[str, sbol2.Document], namespaces=None) -> sbol3
         p = urllib.parse.urlparse(o.identity)
         server = urllib.parse.urlunparse([p.scheme, p.netloc, '', '', '', ''])
         o.namespace = server
-    # infer sequences for locations:
-    for s in (o for o in doc.objects if isinstance(o, sbol3.Component)):
-        if len(s.sequences) != 1:  # can only infer sequences if there is precisely one
-            continue
-        for f in (f for f in s.features if isinstance(f, sbol3.SequenceFeature) or isinstance(f, sbol3.SubComponent)):
-            for loc in f.locations:
-                loc.sequence = s.sequences[0]
-    # TODO: remove remap workarounds after conversions error fixed in https://github.com/sboltools/sbolgraph/issues/17
-    # remap sequence encodings:
-    encoding_remapping = {
-        sbol2.SBOL_ENCODING_IUPAC: sbol3.IUPAC_DNA_ENCODING,
-        sbol2.SBOL_ENCODING_IUPAC_PROTEIN: sbol3.IUPAC_PROTEIN_ENCODING,
-        sbol2.SBOL_ENCODING_SMILES: sbol3.SMILES_ENCODING
-    }
-    for s in (o for o in doc.objects if isinstance(o, sbol3.Sequence)):
-        if s.encoding in encoding_remapping:
-            s.encoding = encoding_remapping[s.encoding]
-    # remap component types:
-    type_remapping = {
-        sbol2.BIOPAX_DNA: sbol3.SBO_DNA,
-        sbol2.BIOPAX_RNA: sbol3.SBO_RNA,
-        sbol2.BIOPAX_PROTEIN: sbol3.SBO_PROTEIN,
-        sbol2.BIOPAX_SMALL_MOLECULE: sbol3.SBO_SIMPLE_CHEMICAL,
-        sbol2.BIOPAX_COMPLEX: sbol3.SBO_NON_COVALENT_COMPLEX
-    }
-    for c in (o for o in doc.objects if isinstance(o, sbol3.Component)):
-        c.types = [(type_remapping[t] if t in type_remapping else t) for t in c.types]
+    # Make a single pass over the document to infer sequences for locations and remap encodings and types
+    for o in doc.objects:
+        if isinstance(o, sbol3.Component):
+            # remap component types:
+            o.types = [_SBOL2_TO_SBOL3_TYPES.get(t, t) for t in o.types]
+            # infer sequences for locations:
+            if len(o.sequences) != 1:  # can only infer sequences if there is precisely one
+                continue
+            for f in (f for f in o.features if isinstance(f, (sbol3.SequenceFeature, sbol3.SubComponent))):
+                for loc in f.locations:
+                    loc.sequence = o.sequences[0]
+        elif isinstance(o, sbol3.Sequence):
+            # remap sequence encodings:
+            remapped = _SBOL2_TO_SBOL3_ENCODINGS.get(o.encoding)
+            if remapped:
+                o.encoding = remapped
 
     # remap orientation types
-    orientation_remapping = {
-        sbol2.SBOL_ORIENTATION_INLINE: sbol3.SBOL_INLINE,
-        sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT: sbol3.SBOL_REVERSE_COMPLEMENT
-    }
-
     def change_orientation(o):
         if isinstance(o, sbol3.Location):
-            if hasattr(o, 'orientation') and o.orientation in orientation_remapping:
-                o.orientation = orientation_remapping[o.orientation]
+            remapped = _SBOL2_TO_SBOL3_ORIENTATIONS.get(getattr(o, 'orientation', None))
+            if remapped:
+                o.orientation = remapped
     doc.traverse(change_orientation)
 
     report = doc.validate()
     if len(report):
-        report_string = "\n".join(str(e) for e in doc.validate())
+        report_string = "\n".join(str(e) for e in report)
         raise ValueError(f'Conversion from SBOL2 to SBOL3 produced an invalid document: {report_string}')
 
     return doc
@@ -172,37 +182,21 @@ def convert3to2(doc3: sbol3.Document) -> sbol2.Document:
     :param doc3: Document to convert
     :return: equivalent SBOL2 document
     """
-    # TODO: remove workarounds after conversion errors fixed in https://github.com/sboltools/sbolgraph/issues/16
-    # remap sequence encodings:
-    encoding_remapping = {
-        sbol3.IUPAC_DNA_ENCODING: sbol2.SBOL_ENCODING_IUPAC,
-        sbol3.IUPAC_PROTEIN_ENCODING: sbol2.SBOL_ENCODING_IUPAC_PROTEIN,
-        sbol3.SMILES_ENCODING: sbol2.SBOL_ENCODING_SMILES
-    }
-    for s in (o for o in doc3.objects if isinstance(o, sbol3.Sequence)):
-        if s.encoding in encoding_remapping:
-            s.encoding = encoding_remapping[s.encoding]
-    # remap component types:
-    type_remapping = {
-        sbol3.SBO_DNA: sbol2.BIOPAX_DNA,
-        sbol3.SBO_RNA: sbol2.BIOPAX_RNA,
-        sbol3.SBO_PROTEIN: sbol2.BIOPAX_PROTEIN,
-        sbol3.SBO_SIMPLE_CHEMICAL: sbol2.BIOPAX_SMALL_MOLECULE,
-        sbol3.SBO_NON_COVALENT_COMPLEX: sbol2.BIOPAX_COMPLEX
-    }
-    for c in (o for o in doc3.objects if isinstance(o, sbol3.Component)):
-        c.types = [(type_remapping[t] if t in type_remapping else t) for t in c.types]
+    # Make a single pass over the document to remap sequence encodings and component types
+    for o in doc3.objects:
+        if isinstance(o, sbol3.Sequence):
+            remapped = _SBOL3_TO_SBOL2_ENCODINGS.get(o.encoding)
+            if remapped:
+                o.encoding = remapped
+        elif isinstance(o, sbol3.Component):
+            o.types = [_SBOL3_TO_SBOL2_TYPES.get(t, t) for t in o.types]
 
     # remap orientation types
-    orientation_remapping = {
-        sbol3.SBOL_INLINE: sbol2.SBOL_ORIENTATION_INLINE,
-        sbol3.SBOL_REVERSE_COMPLEMENT: sbol2.SBOL_ORIENTATION_REVERSE_COMPLEMENT
-    }
-
     def change_orientation(o):
-        if isinstance(o, sbol3.Location) or isinstance(o, sbol3.Feature):
-            if o.orientation in orientation_remapping:
-                o.orientation = orientation_remapping[o.orientation]
+        if isinstance(o, (sbol3.Location, sbol3.Feature)):
+            remapped = _SBOL3_TO_SBOL2_ORIENTATIONS.get(o.orientation)
+            if remapped:
+                o.orientation = remapped
     doc3.traverse(change_orientation)
 
     # Write to an RDF-XML temp file to run through the converter:
@@ -250,18 +244,20 @@ def convert_to_fasta(doc3: sbol3.Document, path: str) -> None:
     :param doc3: SBOL3 document to convert
     :param path: path to write FASTA file to
     """
-    with open(path, 'w') as out:
+    records = []
+    with cached_references(doc3):  # index once instead of a linear find per sequence
         for c in id_sort([c for c in doc3.objects if isinstance(c, sbol3.Component)]):
             # Find all sequences of nucleic acid type
             na_seqs = [s for s in (find_top_level(s) for s in c.sequences)
                        if s.encoding == sbol3.IUPAC_DNA_ENCODING]
             if len(na_seqs) == 0:  # ignore components with no sequence to serialize
                 continue
-            elif len(na_seqs) == 1:  # if there is precisely one sequence, write it to the FASTA
-                record = SeqIO.SeqRecord(Seq(na_seqs[0].elements), id=c.display_id, description=c.description or '')
-                out.write(record.format('fasta'))
+            elif len(na_seqs) == 1:  # if there is precisely one sequence, include it in the FASTA
+                records.append(SeqIO.SeqRecord(Seq(na_seqs[0].elements), id=c.display_id,
+                                               description=c.description or ''))
             else:  # warn about components with ambiguous sequences
                 logging.warning(f'Ambiguous component ({len(na_seqs)} sequences) not converted to FASTA: {c.identity}')
+    SeqIO.write(records, path, 'fasta')
 
 
 def convert_from_fasta(path: str, namespace: str, identity_map: Dict[str, str] = None) -> sbol3.Document:
@@ -331,10 +327,8 @@ def convert_to_genbank(doc3: sbol3.Document, path: str, allow_genbank_online: bo
     doc2 = convert3to2(doc3)
 
     # TODO: remove this kludge after resolution of https://github.com/SynBioDex/libSBOLj/issues/622
-    keepers = {'http://sbols.org/v2', 'http://www.w3.org/ns/prov', 'http://purl.org/dc/terms/',
-               'http://sboltools.org/backport'}
     for c in doc2.componentDefinitions:  # wipe out all annotation properties
-        c.properties = {p: v for p, v in c.properties.items() if any(k for k in keepers if p.startswith(k))}
+        c.properties = {p: v for p, v in c.properties.items() if p.startswith(_GENBANK_KEPT_PROPERTY_NAMESPACES)}
 
     gb_tmp = tempfile.mkstemp(suffix='.gb')[1]
     # Convert document offline
@@ -352,7 +346,7 @@ def convert_to_genbank(doc3: sbol3.Document, path: str, allow_genbank_online: bo
     # also sort the order of the feature qualifiers to ensure they remain stable
     for r in sorted_records:
         for f in r.features:
-            f.qualifiers = {k: f.qualifiers[k] for k in sorted(f.qualifiers)}
+            f.qualifiers = dict(sorted(f.qualifiers.items()))
 
     # write the final file
     SeqIO.write(sorted_records, path, 'gb')
@@ -414,12 +408,13 @@ def command_line_converter(args_dict: Dict[str, Any]):
         convert_to_genbank(doc3, output_file, args_dict['allow_genbank_online'])
     elif output_file_type == 'SBOL2':
         doc2 = convert3to2(doc3)
-        validate_online = sbol2.Config.getOption(sbol2.ConfigOptions.VALIDATE_ONLINE)
+        # convert3to2 has already validated the document, so skip the redundant validation pass on write
+        validate = sbol2.Config.getOption(sbol2.ConfigOptions.VALIDATE)
         try:
-            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE_ONLINE, False)
+            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE, False)
             doc2.write(output_file)
         finally:
-            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE_ONLINE, validate_online)
+            sbol2.Config.setOption(sbol2.ConfigOptions.VALIDATE, validate)
     elif output_file_type == 'SBOL3':
         doc3.write(output_file, sbol3.SORTED_NTRIPLES)
     else:
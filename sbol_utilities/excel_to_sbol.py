@@ -138,7 +138,7 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
     try:  # look up with tyto; if fail, leave blank or add to description
         role = (tyto.SO.get_uri_by_term(raw_role) if raw_role else None)
     except LookupError:
-        logging.warning(f'Role "{raw_role}" could not be found in Sequence Ontology')
+        logging.warning('Role "%s" could not be found in Sequence Ontology', raw_role)
         role = None
     design_notes = (row[config['basic_notes_col']].value if row[config['basic_notes_col']].value else "")
     description = (row[config['basic_description_col']].value if row[config['basic_description_col']].value else "")
@@ -149,7 +149,7 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
     length = row[config['basic_length_col']].value
     raw_sequence = row[config['basic_sequence_col']].value
     sequence = (None if raw_sequence is None else "".join(unicodedata.normalize("NFKD", raw_sequence).upper().split()))
-    if not ((sequence is None and length == 0) or len(sequence) == length):
+    if (len(sequence) if sequence is not None else 0) != length:  # a part without a sequence must have length 0
         raise ValueError(f'Part "{name}" has mismatched sequence length: check for bad characters and extra whitespace')
 
     # identity comes from source if set to a literal table, from display_id if not set
@@ -170,16 +170,16 @@ def row_to_basic_part(doc: sbol3.Document, row, basic_parts: sbol3.Collection, l
                 was_derived_from = raw_url
                 namespace = identity.rsplit('/',1)[0]  # TODO: use a helper function
         else:
-            logging.info(f'Part "{name}" ignoring non-literal source: {source_prefix}')
+            logging.info('Part "%s" ignoring non-literal source: %s', name, source_prefix)
     elif source_id:
-        logging.warning(f'Part "{name}" has source ID specified but not prefix: {source_id}')
+        logging.warning('Part "%s" has source ID specified but not prefix: %s', name, source_id)
     elif source_prefix:
-        logging.warning(f'Part "{name}" has source prefix specified but not ID: {source_prefix}')
+        logging.warning('Part "%s" has source prefix specified but not ID: %s', name, source_prefix)
     if not identity:
         display_id = sbol3.string_to_display_id(name)
 
     # build a component from the material
-    logging.debug(f'Creating basic part "{name}"')
+    logging.debug('Creating basic part "%s"', name)
     component = sbol3.Component(identity or display_id, sbol3.SBO_DNA, name=name, namespace=namespace,
                                 description=f'{design_notes}\n{description}'.strip())
     if was_derived_from:
@@ -240,15 +240,14 @@ def partname_to_part(doc: sbol3.Document, name_or_display_id: str):
 
 def make_composite_component(display_id,part_lists,reverse_complements):
     # Make the composite as an engineered region
-    composite_part = sbol3.Component(display_id, sbol3.SBO_DNA)
-    composite_part.roles.append(sbol3.SO_ENGINEERED_REGION)
+    composite_part = sbol3.Component(display_id, sbol3.SBO_DNA, roles=[sbol3.SO_ENGINEERED_REGION])
     # for each part, make a SubComponent and link them together in sequence
     last_sub = None
     for part_list,rc in zip(part_lists,reverse_complements):
         if not len(part_list)==1:
             raise ValueError(f'Part list should have precisely one element, but is {part_list}')
-        sub = sbol3.SubComponent(part_list[0])
-        sub.orientation = (sbol3.SBOL_REVERSE_COMPLEMENT if rc else sbol3.SBOL_INLINE)
+        orientation = (sbol3.SBOL_REVERSE_COMPLEMENT if rc else sbol3.SBOL_INLINE)
+        sub = sbol3.SubComponent(part_list[0], orientation=orientation)
         composite_part.features.append(sub)
         if last_sub: composite_part.constraints.append(sbol3.Constraint(sbol3.SBOL_MEETS,last_sub,sub))
         last_sub = sub
@@ -270,9 +269,9 @@ def make_constraint(constraint, part_list):
         raise ValueError(f'Do not recognize constraint relation in "{constraint}"')
     x = int(m.group(1))
     y = int(m.group(3))
-    if x is y:
+    if x == y:
         raise ValueError(f'A part cannot constrain itself: {constraint}')
-    for n in [x,y]:
+    for n in (x, y):
        if not (0 < n <= len(part_list)):
            raise ValueError(f'Part number "{str(n)}" is not between 1 and {len(part_list)}')
     return sbol3.Constraint(restriction, part_list[x-1], part_list[y-1])
@@ -282,15 +281,16 @@ def make_combinatorial_derivation(document, display_id,part_lists,reverse_comple
     # Make the combinatorial derivation and its template
     template = sbol3.Component(display_id + "_template", sbol3.SBO_DNA)
     document.add(template)
-    cd = sbol3.CombinatorialDerivation(display_id, template)
-    cd.strategy = sbol3.SBOL_ENUMERATE
+    cd = sbol3.CombinatorialDerivation(display_id, template, strategy=sbol3.SBOL_ENUMERATE)
     # for each part, make a SubComponent or LocalSubComponent in the template and link them together in sequence
     template_part_list = []
     for part_list,rc in zip(part_lists,reverse_complements):
+        # in either case below, orient the template elements as they are constructed
+        orientation = (sbol3.SBOL_REVERSE_COMPLEMENT if rc else sbol3.SBOL_INLINE)
         # it's a variable if there are multiple values or if there's a single value that's a combinatorial derivation
         if len(part_list)>1 or not isinstance(part_list[0],sbol3.Component):
-            sub = sbol3.LocalSubComponent({sbol3.SBO_DNA}) # make a template variable
-            sub.name = "Part "+str(len(template_part_list)+1)
+            sub = sbol3.LocalSubComponent({sbol3.SBO_DNA}, name="Part "+str(len(template_part_list)+1),
+                                          orientation=orientation) # make a template variable
             template.features.append(sub)
             var = sbol3.VariableFeature(cardinality=sbol3.SBOL_ONE, variable=sub)
             cd.variable_features.append(var)
@@ -300,10 +300,9 @@ def make_combinatorial_derivation(document, display_id,part_lists,reverse_comple
                 elif isinstance(part,sbol3.CombinatorialDerivation): var.variant_derivations.append(part)
                 else: raise ValueError("Don't know how to make library element for "+part.name+", a "+str(part))
         else: # otherwise it's a fixed element of the template
-            sub = sbol3.SubComponent(part_list[0])
+            sub = sbol3.SubComponent(part_list[0], orientation=orientation)
             template.features.append(sub)
-        # in either case, orient and order the template elements
-        sub.orientation = (sbol3.SBOL_REVERSE_COMPLEMENT if rc else sbol3.SBOL_INLINE)
+        # in either case, order the template elements
         if template_part_list: template.constraints.append(sbol3.Constraint(sbol3.SBOL_MEETS,template_part_list[-1],sub))
         template_part_list.append(sub)
     # next, add all of the constraints to the template
@@ -345,7 +344,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
     combinatorial = any(x for x in part_lists if len(x) > 1 or isinstance(x[0], sbol3.CombinatorialDerivation))
 
     # Build the composite
-    logging.debug(f'Creating {"library" if combinatorial else "composite part"} "{name}"')
+    logging.debug('Creating %s "%s"', 'library' if combinatorial else 'composite part', name)
     linear_dna_display_id = (f'{display_id}_ins' if backbone_or_locus else display_id)
     if combinatorial:
         composite_part = make_combinatorial_derivation(document, linear_dna_display_id, part_lists, reverse_complements,
@@ -373,7 +372,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
         if any(not is_plasmid(b) for b in backbones):
             raise ValueError(f'Specified backbones "{backbone_or_locus}" are not all plasmids')
         if combinatorial:
-            logging.debug(f"Embedding library '{composite_part.name}' in plasmid backbone(s) '{backbone_or_locus}'")
+            logging.debug("Embedding library '%s' in plasmid backbone(s) '%s'", composite_part.name, backbone_or_locus)
             plasmid = sbol3.Component(f'{display_id}_template', sbol3.SBO_DNA)
             document.add(plasmid)
             part_sub = sbol3.LocalSubComponent([sbol3.SBO_DNA], name="Inserted Construct")
@@ -387,7 +386,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
                 final_products.members.append(plasmid_cd)
         else:
             if len(backbones) == 1:
-                logging.debug(f'Embedding part "{composite_part.name}" in plasmid backbone "{backbone_or_locus}"')
+                logging.debug('Embedding part "%s" in plasmid backbone "%s"', composite_part.name, backbone_or_locus)
                 plasmid = sbol3.Component(display_id, sbol3.SBO_DNA, name=name)
                 document.add(plasmid)
                 part_sub = sbol3.SubComponent(composite_part)
@@ -395,7 +394,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
                 if final_product:
                     final_products.members += {plasmid}
             else:
-                logging.debug(f'Embedding part "{composite_part.name}" in plasmid library "{backbone_or_locus}"')
+                logging.debug('Embedding part "%s" in plasmid library "%s"', composite_part.name, backbone_or_locus)
                 plasmid = sbol3.Component(f'{display_id}_template', sbol3.SBO_DNA)
                 document.add(plasmid)
                 part_sub = sbol3.SubComponent(composite_part)
@@ -409,8 +408,7 @@ def make_composite_part(document, row, composite_parts, linear_products, final_p
             backbone_sub = sbol3.SubComponent(backbones[0])
             plasmid.features.append(backbone_sub)
         else:
-            backbone_sub = sbol3.LocalSubComponent([sbol3.SBO_DNA])
-            backbone_sub.name = "Vector"
+            backbone_sub = sbol3.LocalSubComponent([sbol3.SBO_DNA], name="Vector")
             plasmid.features.append(backbone_sub)
             backbone_var = sbol3.VariableFeature(cardinality=sbol3.SBOL_ONE, variable=backbone_sub)
             plasmid_cd.variable_features.append(backbone_var)
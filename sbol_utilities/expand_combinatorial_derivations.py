@@ -42,10 +42,11 @@ class CombinatorialDerivationExpander:
         :param c: Collection for extraction
         :return: list of Component values found
         """
-        assert all(isinstance(find_top_level(x), sbol3.Collection) or isinstance(find_top_level(x), sbol3.Component) for x in c.members)
-        values = [find_top_level(x) for x in id_sort(c.members) if isinstance(find_top_level(x), sbol3.Component)] + \
-            id_sort(itertools.chain(*([self.collection_values(x) for x in c.members if isinstance(find_top_level(x), sbol3.Collection)])))
-        logging.debug("Found "+str(len(values))+" values in collection "+c.display_id)
+        members = [find_top_level(x) for x in id_sort(c.members)]  # resolve each member only once
+        assert all(isinstance(m, (sbol3.Collection, sbol3.Component)) for m in members)
+        values = [m for m in members if isinstance(m, sbol3.Component)] + \
+            id_sort(itertools.chain(*(self.collection_values(m) for m in members if isinstance(m, sbol3.Collection))))
+        logging.debug("Found %s values in collection %s", len(values), c.display_id)
         return values
 
     def cd_variable_values(self, v: sbol3.VariableFeature) -> List[sbol3.Component]:
@@ -54,12 +55,16 @@ class CombinatorialDerivationExpander:
         :param v: Variable to be flattened
         :return: list of Component values found
         """
-        logging.debug("Finding values for " + find_child(v.variable).name)
+        # only resolve the variable's name for logging when debug output is actually enabled
+        debugging = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debugging:
+            logging.debug("Finding values for %s", find_child(v.variable).name)
         sub_cd_collections = [self.derivation_to_collection(find_top_level(d)) for d in id_sort(v.variant_derivations)]
         values = [find_top_level(x) for x in id_sort(v.variants)] + \
                  id_sort(itertools.chain(*[self.collection_values(c) for c in id_sort(v.variant_collections)])) + \
                  id_sort(itertools.chain(*(self.collection_values(c) for c in id_sort(sub_cd_collections))))
-        logging.debug("Found " + str(len(values)) + " total values for " + find_child(v.variable).name)
+        if debugging:
+            logging.debug("Found %s total values for %s", len(values), find_child(v.variable).name)
         return values
 
     def derivation_to_collection(self, cd: sbol3.CombinatorialDerivation) -> sbol3.Collection:
@@ -73,36 +78,37 @@ class CombinatorialDerivationExpander:
         """
         doc = cd.document
         sbol3.set_namespace(cd.namespace) # use the namespace of the CD for all of its products
-        sort_owned_objects(find_top_level(cd.template)) # TODO: https://github.com/SynBioDex/pySBOL3/issues/231
+        template = find_top_level(cd.template)
+        sort_owned_objects(template) # TODO: https://github.com/SynBioDex/pySBOL3/issues/231
         # we've already converted this CombinatorialDerivation to a Collection, just return the conversion
         if cd in self.expanded_derivations.keys():
-            logging.debug('Found previous expansion of ' + cd.display_id)
+            logging.debug('Found previous expansion of %s', cd.display_id)
             return self.expanded_derivations[cd]
         # if it doesn't already exist, we'll build it
-        logging.debug("Expanding combinatorial derivation " + cd.display_id)
+        logging.debug("Expanding combinatorial derivation %s", cd.display_id)
         # first get all of the values
         values = [id_sort(self.cd_variable_values(v)) for v in id_sort(cd.variable_features)]
         # if this is de facto a collection rather than a CD, just return it directly
         if is_library(cd):
-            logging.debug("Interpreting combinatorial derivation " + cd.display_id + " as library")
+            logging.debug("Interpreting combinatorial derivation %s as library", cd.display_id)
             derivatives = sbol3.Collection(cd.identity + "_collection")
             doc.add(derivatives)
             derivatives.members += values[0]
         else:
             derivatives = sbol3.Collection(cd.identity + "_derivatives")
             doc.add(derivatives)
+            # position of each variable among the template features
+            variable_indices = [template.features.index(find_child(f.variable)) for f in id_sort(cd.variable_features)]
             # create a product-space of all of the possible assignments, then evaluate each in a scratch document
             assignments = itertools.product(*values)
             for a in assignments:
                 # scratch_doc = sbol3.Document()
-                derived = find_top_level(cd.template).clone(cd_assigment_to_display_id(cd, a))
-                logging.debug("Considering derived combination " + derived.display_id)
+                derived = template.clone(cd_assigment_to_display_id(cd, a))
+                logging.debug("Considering derived combination %s", derived.display_id)
                 # scratch_doc.add(derived) # add to the scratch document to enable manipulation of children
                 doc.add(derived)  # add to the scratch document to enable manipulation of children
                 # Replace variables with values
-                newsubs = {
-                    derived.features[find_top_level(cd.template).features.index(find_child(f.variable))]: sbol3.SubComponent(v)
-                    for f, v in zip(id_sort(cd.variable_features), a)}
+                newsubs = {derived.features[i]: sbol3.SubComponent(v) for i, v in zip(variable_indices, a)}
                 for f in id_sort(newsubs.keys()):
                     replace_feature(derived, f, newsubs[f])
                 # Need to remap everything that points to this feature as well
@@ -128,10 +134,10 @@ def expand_derivations(targets: List[sbol3.CombinatorialDerivation]) -> List[sbo
     """
     # Make sure input is a unique set of CombinatorialDerivation objects
     assert all(isinstance(t, sbol3.CombinatorialDerivation) for t in targets), \
-        'Some expansion targets are not SBOL CombinatorialDerivation objects: ' + \
-        str(t for t in targets if not isinstance(t, sbol3.CombinatorialDerivation))
+        'Some expansion targets are not SBOL CombinatorialDerivation objects: ' \
+        f'{[t for t in targets if not isinstance(t, sbol3.CombinatorialDerivation)]}'
     assert len(set(targets)) == len(targets), \
-        'All expansion targets must be unique; found '+str(len(targets)-len(set(targets)))+' duplicates'
+        f'All expansion targets must be unique; found {len(targets)-len(set(targets))} duplicates'
     assert len({t.document for t in targets}) == 1 and targets[0].document is not None, \
         'All expansion targets must be located in a single SBOL Document'
     input_doc = targets[0].document
@@ -139,9 +145,9 @@ def expand_derivations(targets: List[sbol3.CombinatorialDerivation]) -> List[sbo
     # Output document will contain the derivative collections for each target
     expander = CombinatorialDerivationExpander()
     for cd in targets:
-        logging.info('Expanding derivation '+cd.display_id)
+        logging.info('Expanding derivation %s', cd.display_id)
         expander.derivation_to_collection(cd)
-        logging.info("Expansion finished, producing "+str(len(expander.expanded_derivations[cd].members))+" designs")
+        logging.info('Expansion finished, producing %s designs', len(expander.expanded_derivations[cd].members))
 
     # Make sure the document is still OK, then return
     report = input_doc.validate()
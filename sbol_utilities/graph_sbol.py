@@ -8,29 +8,42 @@ def graph_sbol(doc: sbol3.Document, file_format: str = "pdf", view_now: bool = F
     g = doc.graph()
     dot_master = graphviz.Digraph()
 
+    # Nodes recur across many edges, so compute each label and stripped name only once per URI
+    labels = {}
+    names = {}
+
+    def label(uri):
+        key = str(uri)
+        if key not in labels:
+            labels[key] = _get_node_label(g, uri)
+        return labels[key]
+
+    def name(uri):
+        key = str(uri)
+        if key not in names:
+            names[key] = _strip_scheme(uri)
+        return names[key]
+
     dot = graphviz.Digraph(name='cluster_toplevels')
     for obj in doc.objects:
         dot.graph_attr['style'] = 'invis'
 
         # Graph TopLevel
-        obj_label = _get_node_label(g, obj.identity)
         dot.node('Document')
-        dot.node(_strip_scheme(obj.identity))
-        dot.edge('Document', _strip_scheme(obj.identity))
+        dot.node(name(obj.identity))
+        dot.edge('Document', name(obj.identity))
     dot_master.subgraph(dot)
 
     for obj in doc.objects:
-        dot = graphviz.Digraph(name='cluster_%s' %_strip_scheme(obj.identity))
+        dot = graphviz.Digraph(name='cluster_%s' %name(obj.identity))
         dot.graph_attr['style'] = 'invis'
 
         # Graph owned objects
         t = _visit_children(obj, [])
         for start_node, edge, end_node in t:
-            start_label = _get_node_label(g, start_node)
-            end_label = _get_node_label(g, end_node)
-            dot.node(_strip_scheme(start_node), label=start_label)
-            dot.node(_strip_scheme(end_node), label=end_label)
-            dot.edge(_strip_scheme(start_node), _strip_scheme(end_node), label=edge, **composition_relationship)
+            dot.node(name(start_node), label=label(start_node))
+            dot.node(name(end_node), label=label(end_node))
+            dot.edge(name(start_node), name(end_node), label=edge, **composition_relationship)
         dot_master.subgraph(dot)
 
     for obj in doc.objects:
@@ -38,14 +51,12 @@ def graph_sbol(doc: sbol3.Document, file_format: str = "pdf", view_now: bool = F
         t = _visit_associations(obj, [])
         for triple in t:
             start_node, edge, end_node = triple
-            start_label = _get_node_label(g, start_node)
-            end_label = _get_node_label(g, end_node)
-            dot_master.node(_strip_scheme(start_node), label=start_label)
-            dot_master.node(_strip_scheme(end_node), label=end_label)
+            dot_master.node(name(start_node), label=label(start_node))
+            dot_master.node(name(end_node), label=label(end_node))
             # See https://stackoverflow.com/questions/2499032/subgraph-cluster-ranking-in-dot
             # constraint=false commonly gives unnecessarily convoluted edges.
             # It seems that weight=0 gives better results:
-            dot_master.edge(_strip_scheme(start_node), _strip_scheme(end_node), label=edge, weight='0', **association_relationship)
+            dot_master.edge(name(start_node), name(end_node), label=edge, weight='0', **association_relationship)
         
     #print(dot_master.source)
     dot_master.render(outfile, view=view_now, format=file_format)
@@ -64,7 +75,9 @@ def _strip_scheme(uri):
     return uri.split('//')[-1]
 
 
-def _visit_children(obj, triples=[]):
+def _visit_children(obj, triples=None):
+    if triples is None:
+        triples = []
     for property_name, sbol_property in obj.__dict__.items():
         if isinstance(sbol_property, sbol3.ownedobject.OwnedObjectSingletonProperty):
             child = sbol_property.get()
@@ -82,7 +95,9 @@ def _visit_children(obj, triples=[]):
     return triples
 
 
-def _visit_associations(obj, triples=[]):
+def _visit_associations(obj, triples=None):
+    if triples is None:
+        triples = []
     for property_name, sbol_property in obj.__dict__.items():
         if isinstance(sbol_property, sbol3.refobj_property.ReferencedObjectSingleton):
             referenced_object = sbol_property.get()
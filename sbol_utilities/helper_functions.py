@@ -1,4 +1,5 @@
 from __future__ import annotations
+import functools
 import logging
 import itertools
 from collections.abc import Generator
@@ -106,16 +107,12 @@ def find_child(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identified]]
             # a parent or the document does not have the cache
             # attribute. In either case, proceed without a cache
             pass
-    try:
-        return cache[str(ref)]
-    except KeyError:
-        # KeyError means the item was not found in the cache. Ignore
-        # the error and fall through to a lookup below.
-        pass
-    except TypeError:
-        # TypeError probably means the cache object is not subscriptable.
-        # Ignore the error and fall through to a lookup below.
-        pass
+    if cache is not None:
+        # Misses fall through to a lookup below; using get avoids raising
+        # and catching an exception on every uncached lookup
+        cached = cache.get(str(ref))
+        if cached is not None:
+            return cached
     child = ref.lookup()
     if not child:
         raise ChildNotFound(f'Could not find child object in document: {ref}')
@@ -141,16 +138,12 @@ def find_top_level(ref: ReferencedURI, cache: Optional[dict[str, sbol3.Identifie
             # a parent or the document does not have the cache
             # attribute. In either case, proceed without a cache
             pass
-    try:
-        return cache[str(ref)]
-    except KeyError:
-        # KeyError means the item was not found in the cache. Ignore
-        # the error and fall through to a lookup below.
-        pass
-    except TypeError:
-        # TypeError probably means the cache object is not subscriptable.
-        # Ignore the error and fall through to a lookup below.
-        pass
+    if cache is not None:
+        # Misses fall through to a lookup below; using get avoids raising
+        # and catching an exception on every uncached lookup
+        cached = cache.get(str(ref))
+        if cached is not None:
+            return cached
     top_level = ref.lookup()
     if not top_level:
         raise TopLevelNotFound(f'Could not find top-level object in document: {ref}')
@@ -194,10 +187,10 @@ def strip_sbol2_version(identity: str) -> str:
     :param identity: URI to be sanitized
     :return: URI without terminal version, if any
     """
-    last_segment = identity.split('/')[-1]
+    prefix, separator, last_segment = identity.rpartition('/')  # split off only the last segment
     try:
         _ = int(last_segment)  # if last segment is a number...
-        return identity.rsplit('/', 1)[0]  # ... then return everything else
+        return prefix if separator else identity  # ... then return everything else
     except ValueError:  # if last segment was not a number, there is no version to strip
         return identity
 
@@ -255,6 +248,23 @@ def url_to_identity(url: str) -> str:
     return f'{split[0]}/{sbol3.string_to_display_id(split[1])}'
 
 
+@functools.lru_cache(maxsize=None)
+def _plasmid_roles() -> frozenset:
+    """Regularized SO roles that indicate a plasmid"""
+    return frozenset({tyto.SO.plasmid, tyto.SO.vector_replicon, tyto.SO.plasmid_vector})
+
+
+@functools.lru_cache(maxsize=1000)
+def _regularize_so_role(role: str) -> Optional[str]:
+    """Regularize an SO role URI by round-tripping it through its term, returning None if it is not an SO term
+    Failed lookups are cached here as well, since tyto's own cache only retains successful ones
+    """
+    try:
+        return tyto.SO.get_uri_by_term(tyto.SO.get_term_by_uri(role))
+    except LookupError:
+        return None
+
+
 def is_plasmid(obj: Union[sbol3.Component, sbol3.Feature]) -> bool:
     """Check if an SBOL Component or Feature is a plasmid-like structure, i.e., either circular or having a plasmid role
 
@@ -265,20 +275,18 @@ def is_plasmid(obj: Union[sbol3.Component, sbol3.Feature]) -> bool:
         # TODO: replace speed-kludge with this proper query after resolution of https://github.com/SynBioDex/tyto/issues/32
         #return any(r for r in x.roles if tyto.SO.plasmid.is_ancestor_of(r) or tyto.SO.vector_replicon.is_ancestor_of(r))
         # speed-kludge alternative:
-        plasmid_roles = {tyto.SO.plasmid, tyto.SO.vector_replicon, tyto.SO.plasmid_vector}
+        plasmid_roles = _plasmid_roles()
         for r in x.roles:
-            try:
-                regularized = tyto.SO.get_uri_by_term(tyto.SO.get_term_by_uri(r))
-                if regularized in plasmid_roles:
-                    return True
-            except LookupError:
-                pass
+            if r in plasmid_roles:  # already in regular form, so no need for a tyto round-trip
+                return True
+            if _regularize_so_role(r) in plasmid_roles:
+                return True
         return False
 
     if has_plasmid_role(obj):  # both components and features have roles that can indicate a plasmid type
         return True
-    elif isinstance(obj, sbol3.Component) or isinstance(obj, sbol3.LocalSubComponent) or \
-            isinstance(obj, sbol3.ExternallyDefined):  # if there's a type, check for circularity
+    elif isinstance(obj, (sbol3.Component, sbol3.LocalSubComponent, sbol3.ExternallyDefined)):
+        # if there's a type, check for circularity
         return sbol3.SO_CIRCULAR in obj.types
     elif isinstance(obj, sbol3.SubComponent):  # if it's a subcomponent, check its definition
         return is_plasmid(find_top_level(obj.instance_of))
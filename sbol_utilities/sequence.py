@@ -16,7 +16,7 @@ def unambiguous_dna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_DNA_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acgt') == ''
+    return not sequence.strip('acgtACGT')
 
 
 def unambiguous_rna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
@@ -29,7 +29,7 @@ def unambiguous_rna_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_RNA_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acgu') == ''
+    return not sequence.strip('acguACGU')
 
 
 def unambiguous_protein_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
@@ -42,4 +42,4 @@ def unambiguous_protein_sequence(sequence: Union[str, sbol3.Sequence]) -> bool:
         if sequence.encoding != sbol3.IUPAC_PROTEIN_ENCODING:
             return False
         sequence = sequence.elements
-    return sequence.lower().strip('acdefghiklmnpqrstvwy') == ''
+    return not sequence.strip('acdefghiklmnpqrstvwyACDEFGHIKLMNPQRSTVWY')
@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Optional, Dict
 
 import sbol3
 import tyto
@@ -43,31 +43,48 @@ def sort_owned_objects(self):
 
 # Kludges for copying certain types of TopLevel objects
 # TODO: delete after resolution of https://github.com/SynBioDex/pySBOL3/issues/235, along with following functions
-def copy_toplevel_and_dependencies(target, t):
-    if not target.find(t.identity):
-        if isinstance(t, sbol3.Collection):
-            copy_collection_and_dependencies(target, t)
-        elif isinstance(t, sbol3.Component):
-            copy_component_and_dependencies(target, t)
-        elif isinstance(t, sbol3.Sequence):
-            t.copy(target)  # no dependencies for Sequence
-        else:
-            raise ValueError("Not set up to copy dependencies of "+str(t))
-
-
-def copy_collection_and_dependencies(target, c):
-    c.copy(target)
+def copy_toplevel_and_dependencies(target, t, copied: Optional[Dict[str, sbol3.TopLevel]] = None):
+    # Track copied identities in a dictionary: Document.find is a linear scan, and shared dependencies are revisited
+    if copied is None:
+        copied = {o.identity: o for o in target.objects}
+    if t.identity not in copied:
+        # Dispatch on exact type, falling back to an isinstance search for subclasses
+        copier = _DEPENDENCY_COPIERS.get(type(t))
+        if copier is None:
+            copier = next((f for c, f in _DEPENDENCY_COPIERS.items() if isinstance(t, c)), None)
+        if copier is None:
+            raise ValueError(f'Not set up to copy dependencies of {t}')
+        copier(target, t, copied)
+
+
+def copy_collection_and_dependencies(target, c, copied: Optional[Dict[str, sbol3.TopLevel]] = None):
+    if copied is None:
+        copied = {o.identity: o for o in target.objects}
+    copied[c.identity] = c.copy(target)  # record before recursing, so cycles and shared members are copied once
     for m in id_sort(c.members):
-        copy_toplevel_and_dependencies(target, m.lookup())
+        copy_toplevel_and_dependencies(target, m.lookup(), copied)
 
 
-def copy_component_and_dependencies(target, c):
-    c.copy(target)
+def copy_component_and_dependencies(target, c, copied: Optional[Dict[str, sbol3.TopLevel]] = None):
+    if copied is None:
+        copied = {o.identity: o for o in target.objects}
+    copied[c.identity] = c.copy(target)  # record before recursing, so cycles and shared members are copied once
     for f in id_sort(c.features):
         if isinstance(f, sbol3.SubComponent):
-            copy_toplevel_and_dependencies(target, f.instance_of.lookup())
+            copy_toplevel_and_dependencies(target, f.instance_of.lookup(), copied)
     for s in id_sort(c.sequences):
-        copy_toplevel_and_dependencies(target, s.lookup())
+        copy_toplevel_and_dependencies(target, s.lookup(), copied)
+
+
+def _copy_sequence(target, s, copied: Dict[str, sbol3.TopLevel]):
+    copied[s.identity] = s.copy(target)  # no dependencies for Sequence
+
+
+_DEPENDENCY_COPIERS = {
+    sbol3.Collection: copy_collection_and_dependencies,
+    sbol3.Component: copy_component_and_dependencies,
+    sbol3.Sequence: _copy_sequence
+}
 
 
 # Kludge for replacing a feature in a Component
@@ -33,6 +33,18 @@ class TestExcel2SBOL(unittest.TestCase):
         doc.write(temp_name, sbol3.SORTED_NTRIPLES)
         self.assertFalse(sbol_diff.file_diff(temp_name, os.path.join(TESTFILE_DIR, 'simple_library.nt')))
 
+    def test_basic_part_length_mismatch(self):
+        """Test that a basic part with a length but no sequence is reported as a length mismatch"""
+        sbol3.set_namespace('http://sbolstandard.org/testfiles')
+        config = sbol_utilities.excel_to_sbol.expand_configuration({})
+        ws = openpyxl.Workbook().active
+        ws.append(['Unsequenced part'] + [None] * (config['basic_length_col'] - 1) + [10, None])
+        row = next(ws.iter_rows())
+        doc = sbol3.Document()
+        collections = [sbol3.Collection(name) for name in ('BasicParts', 'LinearDNAProducts', 'FinalProducts')]
+        with self.assertRaises(ValueError):
+            sbol_utilities.excel_to_sbol.row_to_basic_part(doc, row, *collections, config, {})
+
     def test_custom_conversion(self):
         """Test if conversion works correctly when the config us used to change expected sheet structure"""
         wb = openpyxl.load_workbook(os.path.join(TESTFILE_DIR, 'nonstandard_simple_library.xlsx'), data_only=True)
@@ -12,7 +12,7 @@ from pathlib import Path
 from sbol_utilities.sbol_diff import file_diff
 from sbol_utilities.workarounds import copy_toplevel_and_dependencies
 from sbol_utilities.expand_combinatorial_derivations import root_combinatorial_derivations, \
-    expand_derivations
+    expand_derivations, CombinatorialDerivationExpander
 
 TESTFILE_DIR = Path(__file__).parent / 'test_files'
 
@@ -54,6 +54,18 @@ class TestCDExpansion(unittest.TestCase):
         assert len(doc.find('Two_by_six_derivatives').members) == 12
         assert len(doc.find('Backbone_variants_derivatives').members) == 2
 
+    def test_nested_collection_values(self):
+        """Test that values are collected from collections nested within collections"""
+        sbol3.set_namespace('http://sbolstandard.org/testfiles')
+        doc = sbol3.Document()
+        a = sbol3.Component('a', sbol3.SBO_DNA)
+        b = sbol3.Component('b', sbol3.SBO_DNA)
+        inner = sbol3.Collection('inner', members=[b])
+        outer = sbol3.Collection('outer', members=[a, inner])
+        doc.add([a, b, inner, outer])
+        values = CombinatorialDerivationExpander().collection_values(outer)
+        assert [v.identity for v in values] == [a.identity, b.identity]
+
     #def test_constraints():  # TODO: to be added when constraint-handling is incorporated.
         # wb = openpyxl.load_workbook(TESTFILE_DIR + '/constraints_library.nt', data_only=True)
         # sbol3.set_namespace('http://sbolstandard.org/testfiles')